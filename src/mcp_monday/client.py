@@ -0,0 +1,434 @@
+"""
+Interactive MCP client for the Monday.com server.
+Connects over stdio and exposes the server tools through a simple menu.
+"""
+import asyncio
+import csv
+import json
+import sys
+import time
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+# orjson parses/serializes ~5x faster than stdlib and emits UTF-8 directly;
+# bind the helpers once at import so the hot paths carry no per-call
+# "is orjson available" branch
+try:
+    import orjson
+
+    def _loads(text):
+        """Parse JSON text with orjson"""
+        return orjson.loads(text)
+
+    def _dumps(data):
+        """Serialize to pretty-printed JSON text with orjson"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _loads(text):
+        """Parse JSON text with stdlib json"""
+        return json.loads(text)
+
+    def _dumps(data):
+        """Serialize to pretty-printed JSON text with stdlib json"""
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+SERVER_PARAMS = StdioServerParameters(command=sys.executable, args=["-m", "mcp_monday"])
+
+def write_prompt(text):
+    """Write a prompt directly to stdout, bypassing print() buffering"""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+async def connect_stdin():
+    """Attach sys.stdin to an asyncio StreamReader (None on win32, where
+    connect_read_pipe does not support stdin)"""
+    if sys.platform == 'win32':
+        return None
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    return reader
+
+async def read_line(reader, prompt="> "):
+    """Read one line from the user without blocking the event loop.
+
+    Raises EOFError when stdin is closed (Ctrl-D, exhausted pipe) — on the
+    win32 path input() already does, and readline() signals it with b''."""
+    write_prompt(prompt)
+    if reader is None:
+        return (await asyncio.to_thread(input)).strip()
+    line = await reader.readline()
+    if not line:
+        raise EOFError
+    return line.decode().strip()
+
+# Parsed board schema memoized per session: both display_board_schema and the
+# parameter prompts would otherwise re-fetch and re-parse the same payload
+_schema_cache = {}
+_schema_locks = {}
+
+async def get_schema(session, ttl=30):
+    """Read and parse monday://board/schema, cached per session with a TTL"""
+    key = id(session)
+    cached = _schema_cache.get(key)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    # Coalesce concurrent misses so a prefetch racing a prompt does not
+    # trigger two identical round-trips
+    lock = _schema_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        cached = _schema_cache.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        result = await session.read_resource("monday://board/schema")
+        schema = BoardSchema(_loads(result.contents[0].text))
+        _schema_cache[key] = (time.monotonic(), schema)
+        return schema
+
+def invalidate_schema(session):
+    """Drop the cached schema, e.g. after a tool mutated the board"""
+    _schema_cache.pop(id(session), None)
+
+def release_schema(session):
+    """Drop a session's schema cache entry and its refresh lock; called when
+    the session ends so neither outlives it"""
+    invalidate_schema(session)
+    _schema_locks.pop(id(session), None)
+
+# Rendered column block for the most recent schema object: settings parsing
+# and string building happen once per schema fetch, not per prompt
+_rendered_schema = (None, "")
+
+class Column:
+    """One board column, unpacked once at fetch time; slot attribute access
+    replaces repeated dict lookups everywhere the column is consumed"""
+    __slots__ = ("id", "title", "type", "options")
+
+    def __init__(self, col):
+        self.id = col.get("id", "")
+        self.title = col.get("title", "")
+        self.type = col.get("type", "")
+        self.options = _column_options(col)
+
+class BoardSchema:
+    """Typed view of the monday://board/schema payload"""
+    __slots__ = ("board", "columns", "groups")
+
+    def __init__(self, data):
+        self.board = data.get("board_info", {})
+        self.columns = tuple(Column(c) for c in data.get("columns", []))
+        self.groups = tuple(data.get("groups", []))
+
+def _column_options(col):
+    """Joined label options for a column, '' when it has none.
+
+    Only label-bearing column types carry labels in settings_str; the JSON
+    parse is skipped for the rest (text, date, numbers, ...)."""
+    if col.get("type") not in ("status", "dropdown", "color") or not col.get("settings_str"):
+        return ""
+
+    try:
+        labels = _loads(col["settings_str"]).get("labels")
+    except ValueError:
+        return ""
+    if not labels:
+        return ""
+
+    values = labels.values() if isinstance(labels, dict) else labels
+    return ', '.join(map(str, values))
+
+def _render_schema(schema):
+    """Build the column-hint block for a BoardSchema; the Column slots were
+    filled at fetch time, so this is one comprehension of attribute reads"""
+    return "\n".join(
+        ["\nBoard columns:"]
+        + [f"- {c.title} ({c.id}): {c.type}" + (f" options: {c.options}" if c.options else "")
+           for c in schema.columns]
+        + [""]
+    )
+
+async def display_board_schema(session):
+    """Show the board columns as a hint when filling in parameters"""
+    global _rendered_schema
+    schema = await get_schema(session)
+
+    if _rendered_schema[0] is not schema:
+        _rendered_schema = (schema, _render_schema(schema))
+
+    write_prompt(_rendered_schema[1])
+
+def build_tool_menu(tools):
+    """Render the tool menu once; redraws just re-write the same string"""
+    return (
+        "\nAvailable tools:\n"
+        + "\n".join(f"{i}. {t.name} - {t.description or 'No description available'}"
+                    for i, t in enumerate(tools, 1))
+        + "\nr. Refresh tool list\nq. Quit\n"
+    )
+
+# Parameters whose prompt should be preceded by the column hint display,
+# as a module-level frozenset rather than a list literal rebuilt per call
+_SCHEMA_HINT_PARAMS = frozenset({"column_values", "field"})
+
+def parse_field_values(line):
+    """Parse comma-separated 'column=value' pairs into a dict.
+
+    Tokenized with csv.reader so values containing commas can be quoted,
+    and split with str.partition (no list allocation per pair). Built as a
+    dict comprehension, which runs on the specialized MAP_ADD opcode rather
+    than per-entry __setitem__ calls."""
+    pairs = (token.partition('=') for token in next(csv.reader([line], skipinitialspace=True)))
+    return {key.strip(): value.strip() for key, _, value in pairs if key and value}
+
+async def _read_column_values(reader):
+    """Read all column values with a single prompt.
+
+    One batched 'column=value, column=value, ...' line replaces the old
+    line-per-column loop: one read instead of N, and values containing
+    commas can be quoted."""
+    line = await read_line(reader, "column values (column=value, ...): ")
+    return parse_field_values(line) if line else {}
+
+async def _params_field_value(session, tool, reader):
+    """Collect the field/value pair used by the search and delete tools"""
+    await display_board_schema(session)
+    line = await read_line(reader, "field,value: ")
+    # partition returns a 3-tuple unconditionally: no list allocation and no
+    # length check on the per-command path
+    field, _, value = line.partition(',')
+    return {"field": field.strip(), "value": value.strip()}
+
+async def _params_create(session, tool, reader):
+    """Collect parameters for create_board_item"""
+    await display_board_schema(session)
+    params = {"item_name": await read_line(reader, "item_name: ")}
+    params["column_values"] = await _read_column_values(reader)
+
+    group_id = await read_line(reader, "group_id (optional): ")
+    if group_id:
+        params["group_id"] = group_id
+    return params
+
+async def _params_update(session, tool, reader):
+    """Collect parameters for update_board_item"""
+    await display_board_schema(session)
+    params = {"item_id": await read_line(reader, "item_id: ")}
+    params["column_values"] = await _read_column_values(reader)
+    return params
+
+async def _params_generic(session, tool, reader):
+    """Prompt for each parameter declared in the tool's input schema"""
+    params = {}
+    schema = tool.inputSchema or {}
+    properties = schema.get("properties", {})
+
+    # Show column hints for tools that take column ids or values, reusing the
+    # session-cached schema instead of reading the resource again
+    if _SCHEMA_HINT_PARAMS & properties.keys():
+        await display_board_schema(session)
+
+    for name, info in properties.items():
+        value = await read_line(reader, f"{name} ({info.get('type', 'string')}): ")
+        if not value:
+            continue
+
+        if info.get("type") == "object":
+            # Accept raw JSON or the 'column=value, ...' shorthand; malformed
+            # JSON re-prompts instead of unwinding the whole session
+            while value and value[0] in '{[':
+                try:
+                    value = _loads(value)
+                    break
+                except ValueError:
+                    value = await read_line(reader, f"{name} (invalid JSON, try again): ")
+            if isinstance(value, str):
+                value = parse_field_values(value)
+            if value:
+                params[name] = value
+        else:
+            params[name] = value
+
+    return params
+
+# Per-tool parameter collectors, dispatched by name; unknown tools fall back
+# to the schema-driven generic prompt
+PARAM_HANDLERS = {
+    "search_board_items": _params_field_value,
+    "delete_board_items": _params_field_value,
+    "create_board_item": _params_create,
+    "update_board_item": _params_update,
+}
+
+async def get_tool_parameters(session, tool, reader):
+    """Collect parameter values for a tool from the user"""
+    return await PARAM_HANDLERS.get(tool.name, _params_generic)(session, tool, reader)
+
+def _render_item_list(data, key, batch=200):
+    """Emit item-list responses incrementally: serializing the whole board
+    into one indented string would hold a third full-size copy of the
+    payload in memory before anything reaches the terminal.
+
+    Items are joined and written in batches so a line-buffered terminal
+    costs one syscall per batch rather than two per item."""
+    parts = [_dumps({k: v for k, v in data.items() if k != key})]
+    for item in data[key]:
+        parts.append(_dumps(item))
+        if len(parts) >= batch:
+            sys.stdout.write("\n".join(parts))
+            sys.stdout.write("\n")
+            parts = []
+
+    if parts:
+        sys.stdout.write("\n".join(parts))
+        sys.stdout.write("\n")
+    sys.stdout.flush()
+
+# Response renderers keyed by their discriminating field; dispatch is one
+# scan for the first present key plus one dict lookup
+_RENDERERS = {
+    "items": _render_item_list,
+    "deleted_items": _render_item_list,
+}
+
+def _echo_raw(text, limit=4096):
+    """Echo a non-JSON (or unparseable) response, truncating huge payloads
+    so the diagnostic path never copies megabytes to the terminal"""
+    if len(text) > limit:
+        print(text[:500] + f"... ({len(text)} chars, truncated)")
+    else:
+        print(text)
+
+def format_response(content):
+    """Pretty-print one piece of tool result content"""
+    if content.type != "text":
+        print(content)
+        return
+
+    # Cheapest parse is no parse: plain-text responses never start with a
+    # JSON container, so skip the decoder (and its exception) entirely
+    text = content.text.lstrip()
+    if not text or text[0] not in '{[':
+        _echo_raw(content.text)
+        return
+
+    try:
+        data = _loads(text)
+    except ValueError:
+        _echo_raw(content.text)
+        return
+
+    if isinstance(data, dict):
+        key = next((k for k in _RENDERERS if isinstance(data.get(k), list) and data[k]), None)
+        if key is not None:
+            _RENDERERS[key](data, key)
+            return
+
+    # The parse above is only needed for renderer dispatch; for everything
+    # else echo the text we already have instead of paying a second
+    # full serialization pass over the decoded object
+    sys.stdout.write(text)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+# Tools whose success means the cached schema may be stale
+_MUTATING_TOOLS = frozenset({"create_board_item", "update_board_item", "delete_board_items"})
+
+async def execute_tool(session, tool, params):
+    """Call a tool and print its result"""
+    result = await session.call_tool(tool.name, params)
+    for content in result.content:
+        format_response(content)
+
+    if tool.name in _MUTATING_TOOLS:
+        invalidate_schema(session)
+
+async def interactive_loop(session, reader, tools_task=None):
+    """Main menu loop of the client"""
+    # The tool list is static for a session: fetch it once instead of paying
+    # a round-trip per menu display ('r' re-fetches on demand)
+    if tools_task is not None:
+        tools = (await tools_task).tools
+    else:
+        tools = (await session.list_tools()).tools
+    menu = build_tool_menu(tools)
+
+    while True:
+        write_prompt(menu)
+
+        # The stdin read keeps the loop free, so warm the schema cache while
+        # the user is thinking; the parameter prompts then hit the cache
+        prefetch = asyncio.create_task(get_schema(session))
+        prefetch.add_done_callback(lambda t: t.exception())
+
+        # Closed stdin ends the session like 'q' — without this the loop
+        # would spin on empty reads, redrawing the menu forever
+        try:
+            choice = await read_line(reader)
+        except EOFError:
+            break
+
+        if choice.lower() == 'q':
+            break
+
+        if choice.lower() == 'r':
+            tools = (await session.list_tools()).tools
+            menu = build_tool_menu(tools)
+            continue
+
+        # isdigit() is a cheap byte scan; raising ValueError on every typo
+        # costs hundreds of ns of exception setup/unwind
+        if not choice.isdigit() or not 1 <= int(choice) <= len(tools):
+            print("Invalid choice")
+            continue
+
+        tool = tools[int(choice) - 1]
+
+        try:
+            params = await get_tool_parameters(session, tool, reader)
+        except EOFError:
+            break
+        await execute_tool(session, tool, params)
+
+async def main():
+    """Run the interactive client against the Monday.com MCP server"""
+    async with stdio_client(SERVER_PARAMS) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            # MCP requires initialize to complete before other requests, but
+            # the tool listing and the schema fetch depend only on the
+            # handshake, not on each other: run both as tasks so they overlap
+            # with each other and with attaching stdin, leaving the first
+            # menu iteration with no round-trip at all
+            tools_task = asyncio.create_task(session.list_tools())
+            schema_task = asyncio.create_task(get_schema(session))
+            schema_task.add_done_callback(lambda t: t.exception())
+            reader = await connect_stdin()
+            try:
+                await interactive_loop(session, reader, tools_task)
+            finally:
+                release_schema(session)
+
+def run():
+    """Entry point: install uvloop where supported, then run the client"""
+    # Plain sync setup, done before asyncio.run so the reconfigured streams
+    # are what the event loop machinery captures
+    if sys.platform == 'win32':
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+        sys.stdin.reconfigure(encoding='utf-8', errors='replace')
+
+    # uvloop roughly doubles throughput for stdio/stream workloads like MCP;
+    # it does not support Windows
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
+    asyncio.run(main())
+
+if __name__ == "__main__":
+    run()
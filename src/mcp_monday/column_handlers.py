@@ -0,0 +1,647 @@
+"""
+Column type handlers for Monday.com board values.
+Validates and transforms raw user values into API-ready column payloads.
+"""
+import json
+import logging
+import re
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from functools import lru_cache
+from .config import logger
+
+# rapidfuzz's C++ Levenshtein is 10-100x faster than difflib's pure-Python
+# SequenceMatcher on label dictionaries; fall back to difflib when missing
+try:
+    from rapidfuzz import process as _rf_process, fuzz as _rf_fuzz
+
+    def _close_matches(value, candidates, n=3, cutoff=60):
+        """Closest label suggestions for an invalid value"""
+        return [m for m, _, _ in _rf_process.extract(
+            value, candidates, scorer=_rf_fuzz.WRatio, limit=n, score_cutoff=cutoff)]
+
+    def _batch_close_matches(values, candidates, n=3, cutoff=60):
+        """Suggestions for many invalid values at once.
+
+        cdist scores the whole values x candidates matrix in one parallel
+        C++ kernel instead of a Python extract call per value."""
+        scores = _rf_process.cdist(
+            values, candidates, scorer=_rf_fuzz.WRatio, score_cutoff=cutoff, workers=-1)
+        return [
+            [candidates[j] for j in sorted(
+                (j for j, s in enumerate(row) if s >= cutoff),
+                key=row.__getitem__, reverse=True)[:n]]
+            for row in scores
+        ]
+except ImportError:
+    import difflib
+
+    def _close_matches(value, candidates, n=3, cutoff=60):
+        """Closest label suggestions for an invalid value"""
+        return difflib.get_close_matches(value, candidates, n=n, cutoff=cutoff / 100)
+
+    def _batch_close_matches(values, candidates, n=3, cutoff=60):
+        """Suggestions for many invalid values at once"""
+        return [_close_matches(value, candidates, n, cutoff) for value in values]
+
+# orjson serializes several times faster than stdlib json; only the debug
+# settings dumps go through this, so the fallback stays plain
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(data):
+        """Serialize a settings dict for diagnostics"""
+        return orjson.dumps(data).decode()
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(data):
+        """Serialize a settings dict for diagnostics"""
+        return json.dumps(data)
+
+# ciso8601 parses ISO-8601 (including Z-suffixed) timestamps in C without the
+# per-row .replace('Z', '+00:00') string allocation fromisoformat needs
+try:
+    from ciso8601 import parse_datetime as _parse_dt
+except ImportError:
+    def _parse_dt(text):
+        """Parse an ISO-8601 timestamp, tolerating a Z suffix"""
+        return datetime.fromisoformat(text.replace('Z', '+00:00'))
+
+# Bulk imports repeat the same timestamps (creation batches share one
+# created_at); a cache hit is ~10x cheaper than reparsing
+_parse_dt = lru_cache(maxsize=4096)(_parse_dt)
+
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
+_NUMBER_RE = re.compile(r'^-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?$')
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+@lru_cache(maxsize=2048)
+def _is_valid_email(email):
+    """RFC-lite email check, memoized since addresses repeat across items"""
+    return _EMAIL_RE.match(email) is not None
+
+@lru_cache(maxsize=4096)
+def _is_valid_url(url):
+    """URL validity memoized: link columns repeat the same URLs constantly,
+    so repeats cost a hash hit instead of a regex evaluation"""
+    return _URL_RE.match(url) is not None
+
+# Whether invalid status/dropdown values get fuzzy-matched suggestions by
+# default; bulk writers pass suggest=False to skip the Levenshtein work
+DEFAULT_SUGGEST = True
+
+class ValidationResult:
+    """Outcome of validating a column value.
+
+    __slots__ keeps the per-instance footprint to the four fields — one of
+    these is allocated per cell, so skipping the instance __dict__ matters
+    in bulk. Results without suggestions share one empty tuple instead of
+    allocating a fresh list each."""
+    __slots__ = ("is_valid", "value", "message", "suggestions")
+
+    def __init__(self, is_valid, value=None, message=None, suggestions=None):
+        self.is_valid = is_valid
+        self.value = value
+        self.message = message
+        self.suggestions = suggestions or ()
+
+class MirrorType(Enum):
+    STATUS = "status"
+    TEXT = "text"
+    NUMBER = "number"
+    DATE = "date"
+
+@lru_cache(maxsize=256)
+def _label_rules(col_type, labels_items):
+    """Frozen rules dict for one label-bearing column's settings; repeated
+    schema documentation passes share the allocation"""
+    return {"type": col_type,
+            "allowed_values": [str(text) for _, text in labels_items]}
+
+class ColumnTypeHandler:
+    """Base handler: subclasses override validate_value/transform_value"""
+
+    # Static constraint description; label-bearing handlers override
+    # get_validation_rules to include their settings-derived values
+    rules = {}
+
+    def get_validation_rules(self, settings):
+        """Describe the constraints this handler enforces"""
+        return self.rules
+
+    def validate_value(self, value, settings, suggest=DEFAULT_SUGGEST):
+        """Check a raw value against the column settings.
+
+        suggest=False skips the did-you-mean fuzzy matching in handlers
+        that offer it — bulk writers disable it since suggestions are only
+        useful interactively."""
+        return ValidationResult(True, value)
+
+    def transform_value(self, value, settings):
+        """Convert a validated value into the API payload shape"""
+        return value
+
+    def format_value(self, value, settings):
+        """Validate then transform a raw value.
+
+        The validated (possibly normalized) value is what gets transformed,
+        so transform implementations never need to re-validate."""
+        result = self.validate_value(value, settings)
+        if not result.is_valid:
+            return result
+        return ValidationResult(True, self.transform_value(result.value, settings))
+
+    def format_values(self, values, settings):
+        """Validate and transform a batch of raw values; handlers whose
+        validation blocks on I/O override this to parallelize"""
+        return [self.format_value(value, settings) for value in values]
+
+class TextColumnHandler(ColumnTypeHandler):
+    def transform_value(self, value, settings):
+        logger.debug("Transforming text value: %s", value)
+        return str(value)
+
+@lru_cache(maxsize=512)
+def _status_label_index(labels_items):
+    """Case-folded {label: (label_id, original_text)} index for one settings
+    dict; bulk formatting of rows sharing a column hits the cache"""
+    return {str(text).lower(): (lid, str(text)) for lid, text in labels_items}
+
+@lru_cache(maxsize=512)
+def _status_valid_values(labels_items):
+    """Label texts for the error message and fuzzy matching, built once per
+    settings dict instead of once per invalid row"""
+    return tuple(str(text) for _, text in labels_items)
+
+class StatusColumnHandler(ColumnTypeHandler):
+    def get_validation_rules(self, settings):
+        labels = settings.get("labels", {}) if settings else {}
+        return _label_rules("status", tuple(labels.items()))
+
+    def validate_value(self, value, settings, suggest=DEFAULT_SUGGEST):
+        # Serializing the settings dict is only worth doing if DEBUG records
+        # will actually be emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Validating status with settings: %s", _dumps(settings))
+        labels = settings.get("labels", {}) if settings else {}
+        labels_items = tuple(labels.items())
+        index = _status_label_index(labels_items)
+
+        value_str = str(value)
+        hit = index.get(value_str.lower())
+        if hit:
+            # Hand the finished payload to transform_value so the label is
+            # looked up exactly once per cell
+            return ValidationResult(True, {"label": hit[1]})
+
+        valid_values = _status_valid_values(labels_items)
+        return ValidationResult(
+            False, message=f"Invalid status: {value_str} (valid: {', '.join(valid_values)})",
+            suggestions=_close_matches(value_str, valid_values) if suggest else None
+        )
+
+    def transform_value(self, value, settings):
+        # format_value passes the payload built during validation; the index
+        # probe only runs for direct transform calls
+        if isinstance(value, dict) and "label" in value:
+            return value
+
+        labels = settings.get("labels", {}) if settings else {}
+        index = _status_label_index(tuple(labels.items()))
+        hit = index.get(str(value).lower())
+        return {"label": hit[1]} if hit else {"label": str(value)}
+
+    def format_values(self, values, settings):
+        """Batch variant: resolve exact hits inline, then score every miss
+        against the label list in one _batch_close_matches call instead of
+        one fuzzy-match pass per invalid value"""
+        labels = settings.get("labels", {}) if settings else {}
+        labels_items = tuple(labels.items())
+        index = _status_label_index(labels_items)
+
+        results = [None] * len(values)
+        miss_idx, miss_vals = [], []
+        for i, value in enumerate(values):
+            hit = index.get(str(value).lower())
+            if hit:
+                results[i] = ValidationResult(True, {"label": hit[1]})
+            else:
+                miss_idx.append(i)
+                miss_vals.append(str(value))
+
+        if miss_idx:
+            valid_values = _status_valid_values(labels_items)
+            joined = ', '.join(valid_values)
+            suggestions = _batch_close_matches(miss_vals, valid_values)
+            for i, value, matches in zip(miss_idx, miss_vals, suggestions):
+                results[i] = ValidationResult(
+                    False, message=f"Invalid status: {value} (valid: {joined})",
+                    suggestions=matches)
+
+        return results
+
+@lru_cache(maxsize=512)
+def _dropdown_label_index(names):
+    """Case-folded {name: canonical name} index for one dropdown's labels"""
+    return {name.casefold(): name for name in names}
+
+class DropdownColumnHandler(ColumnTypeHandler):
+    def get_validation_rules(self, settings):
+        labels = settings.get("labels", []) if settings else []
+        names = tuple(str(l.get("name", l)) if isinstance(l, dict) else str(l) for l in labels)
+        return _label_rules("dropdown", tuple(enumerate(names)))
+
+    def validate_value(self, value, settings, suggest=DEFAULT_SUGGEST):
+        labels = settings.get("labels", []) if settings else []
+        names = tuple(str(l.get("name", l)) if isinstance(l, dict) else str(l) for l in labels)
+        value_str = str(value)
+
+        # O(1) probe into the per-settings casefolded index instead of
+        # lowercasing every label on every row; the hit is the board's
+        # canonical casing, which is what the API accepts
+        hit = _dropdown_label_index(names).get(value_str.casefold())
+        if hit is not None:
+            return ValidationResult(True, hit)
+
+        return ValidationResult(
+            False, message=f"Invalid dropdown option: {value} (valid: {', '.join(names)})",
+            suggestions=_close_matches(value_str, names) if suggest else None
+        )
+
+    def transform_value(self, value, settings):
+        # format_value passes the canonical label from validation; the index
+        # probe only runs for direct transform calls
+        labels = settings.get("labels", []) if settings else []
+        names = tuple(str(l.get("name", l)) if isinstance(l, dict) else str(l) for l in labels)
+        value_str = str(value)
+        return {"labels": [_dropdown_label_index(names).get(value_str.casefold(), value_str)]}
+
+class NumberColumnHandler(ColumnTypeHandler):
+    # Hot names bound as default-argument locals (LOAD_FAST instead of a
+    # module-dict probe per call), the same trick functools.lru_cache uses
+    def validate_value(self, value, settings,
+                       _result=ValidationResult, _match=_NUMBER_RE.match):
+        # Already-numeric input needs no parsing; strings get a regex screen
+        # so invalid rows take a branch instead of a raised ValueError.
+        # Exact type check: cheaper than isinstance and keeps bools (a
+        # subclass of int) from validating as numbers
+        if type(value) in (int, float):
+            return _result(True, float(value))
+
+        text = str(value).strip()
+        if _match(text):
+            return _result(True, float(text))
+        return _result(False, message=f"Not a number: {value}")
+
+    def transform_value(self, value, settings):
+        # format_value hands over the float built during validation, so the
+        # conversion only runs for direct transform calls
+        return str(value if type(value) is float else float(value))
+
+class DateColumnHandler(ColumnTypeHandler):
+    rules = {"type": "date", "format": "YYYY-MM-DD"}
+
+    def validate_value(self, value, settings):
+        try:
+            datetime.strptime(str(value), "%Y-%m-%d")
+            return ValidationResult(True, str(value))
+        except ValueError:
+            return ValidationResult(False, message=f"Invalid date (expected YYYY-MM-DD): {value}")
+
+    def transform_value(self, value, settings):
+        return {"date": str(value)[:10]}
+
+def _parse_hhmm(text):
+    """One-pass HH:MM parse: no split list, no int() calls, no exceptions"""
+    if len(text) != 5 or text[2] != ':':
+        return None
+    a, b, c, d = text[0], text[1], text[3], text[4]
+    if not (a.isdigit() and b.isdigit() and c.isdigit() and d.isdigit()):
+        return None
+    hour = (ord(a) - 48) * 10 + (ord(b) - 48)
+    minute = (ord(c) - 48) * 10 + (ord(d) - 48)
+    return (hour, minute) if hour < 24 and minute < 60 else None
+
+class HourColumnHandler(ColumnTypeHandler):
+    def validate_value(self, value, settings):
+        parsed = _parse_hhmm(str(value))
+        if parsed is not None:
+            return ValidationResult(True, {"hour": parsed[0], "minute": parsed[1]})
+        return ValidationResult(False, message=f"Invalid hour (expected HH:MM): {value}")
+
+    def transform_value(self, value, settings):
+        # format_value hands over the validated payload dict; raw strings
+        # only appear on direct calls
+        if isinstance(value, dict):
+            return value
+        result = self.validate_value(value, settings)
+        return result.value if result.is_valid else value
+
+_year_cache = (0.0, 0, 52)
+
+def _year_info():
+    """(current year, its ISO week count), refreshed at most once per second"""
+    global _year_cache
+    stamp, year, weeks = _year_cache
+    now = time.monotonic()
+    if now - stamp > 1.0:
+        year = datetime.now().year
+        # ISO 8601: December 28 always falls in the year's last week, so its
+        # week number is the year's week count (52 or 53)
+        weeks = datetime(year, 12, 28).isocalendar()[1]
+        _year_cache = (now, year, weeks)
+    return year, weeks
+
+def _current_year():
+    """Current calendar year, refreshed at most once per second"""
+    return _year_info()[0]
+
+class WeekColumnHandler(ColumnTypeHandler):
+    def validate_value(self, value, settings):
+        if isinstance(value, int):
+            week = value
+        else:
+            text = str(value).strip()
+            if not text.isdigit():
+                return ValidationResult(False, message=f"Invalid week number: {value}")
+            week = int(text)
+
+        # Bound by the actual week count: accepting week 53 in a 52-week ISO
+        # year would make the transform's fromisocalendar raise after the
+        # value had already been declared valid
+        year, weeks = _year_info()
+        if 1 <= week <= weeks:
+            return ValidationResult(True, week)
+        return ValidationResult(
+            False, message=f"Invalid week number for {year} (1-{weeks}): {value}")
+
+    def transform_value(self, value, settings):
+        year = _current_year()
+        week = int(value)
+        start = datetime.fromisocalendar(year, week, 1)
+        end = datetime.fromisocalendar(year, week, 7)
+        return {"week": {"startDate": start.strftime("%Y-%m-%d"),
+                         "endDate": end.strftime("%Y-%m-%d")}}
+
+class RatingColumnHandler(ColumnTypeHandler):
+    def validate_value(self, value, settings):
+        if isinstance(value, int):
+            rating = value
+        else:
+            text = str(value).strip()
+            if not text.isdigit():
+                return ValidationResult(False, message=f"Invalid rating (0-5): {value}")
+            rating = int(text)
+
+        max_rating = settings.get("max_rating", 5) if settings else 5
+        if 0 <= rating <= max_rating:
+            return ValidationResult(True, rating)
+        return ValidationResult(False, message=f"Invalid rating (0-{max_rating}): {value}")
+
+    def transform_value(self, value, settings):
+        return {"rating": int(value)}
+
+class EmailColumnHandler(ColumnTypeHandler):
+    def validate_value(self, value, settings,
+                       _result=ValidationResult, _valid=_is_valid_email):
+        # The old "'@' in value" screen let malformed addresses through to
+        # the API, where each rejection costs a full round-trip
+        email = str(value)
+        if _valid(email):
+            return _result(True, email)
+        return _result(False, message=f"Invalid email: {value}")
+
+    def transform_value(self, value, settings):
+        email = str(value)
+        return {"email": email, "text": email}
+
+class LinkColumnHandler(ColumnTypeHandler):
+    def validate_value(self, value, settings,
+                       _result=ValidationResult, _valid=_is_valid_url):
+        url = str(value)
+        if _valid(url):
+            return _result(True, url)
+        return _result(False, message=f"Invalid URL: {value}")
+
+    def transform_value(self, value, settings):
+        url = str(value)
+        return {"url": url, "text": url}
+
+def validate_location(address):
+    """Parse a 'lat,lng[,address]' string into a location payload"""
+    parts = str(address).split(',', 2)
+    if len(parts) < 2:
+        return None
+    try:
+        lat, lng = float(parts[0]), float(parts[1])
+    except ValueError:
+        return None
+    return {"lat": str(lat), "lng": str(lng),
+            "address": parts[2].strip() if len(parts) > 2 else ""}
+
+# lru_cache does its linked-list bookkeeping in C, so hits and evictions are
+# O(1) without the Python-level OrderedDict churn; failed parses are cached
+# too, so repeated bad addresses skip the reparse
+_resolve_location = lru_cache(maxsize=1000)(validate_location)
+
+class LocationColumnHandler(ColumnTypeHandler):
+    def validate_value(self, value, settings):
+        # Exact type check on the canonical-payload fast path: bulk-exported
+        # data is plain dicts, and type-is skips the subclass walk
+        if type(value) is dict and "lat" in value and "lng" in value:
+            return ValidationResult(True, value)
+
+        location = _resolve_location(str(value))
+        if location is None:
+            return ValidationResult(
+                False, message=f"Invalid location (expected lat,lng[,address]): {value}")
+        return ValidationResult(True, location)
+
+    def transform_value(self, value, settings):
+        # format_value hands over the resolved location dict; raw strings
+        # only appear on direct calls
+        if type(value) is dict and "lat" in value:
+            return value
+        result = self.validate_value(value, settings)
+        return result.value if result.is_valid else value
+
+    def format_values(self, values, settings):
+        """Batch variant: resolve addresses on a thread pool.
+
+        validate_location is a local parse today, but this is the extension
+        point for a geocoding backend, where per-address latency would
+        dominate a serial loop. lru_cache is thread-safe, so hits return
+        immediately and misses populate it for subsequent batches."""
+        results = [None] * len(values)
+        pending = []
+
+        for i, value in enumerate(values):
+            if type(value) is dict and "lat" in value and "lng" in value:
+                results[i] = ValidationResult(True, value)
+            else:
+                pending.append(i)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(16, len(pending))) as pool:
+                resolved = pool.map(lambda i: _resolve_location(str(values[i])), pending)
+
+            for i, location in zip(pending, resolved):
+                if location is None:
+                    results[i] = ValidationResult(
+                        False,
+                        message=f"Invalid location (expected lat,lng[,address]): {values[i]}")
+                else:
+                    results[i] = ValidationResult(True, location)
+
+        return results
+
+# Interned once at import: the per-call [t.value for t in MirrorType] rebuild
+# cost N enum iterations per row
+_MIRROR_TYPES = frozenset(t.value for t in MirrorType)
+_MIRROR_TYPES_LIST = ', '.join(sorted(_MIRROR_TYPES))
+
+class MirrorColumnHandler(ColumnTypeHandler):
+    def validate_value(self, value, settings):
+        mirror_type = (settings or {}).get("mirror_type", "text")
+        if mirror_type in _MIRROR_TYPES:
+            return ValidationResult(True, value)
+        return ValidationResult(
+            False,
+            message=f"Unsupported mirror type: {mirror_type} (valid: {_MIRROR_TYPES_LIST})")
+
+    def transform_value(self, value, settings):
+        return str(value)
+
+def _make_readonly_handler(timestamp_key, col_name):
+    """Handler class for read-only audit columns.
+
+    creation_log and last_updated differ only in the timestamp key and the
+    column named in the rejection; generating the class keeps one method
+    body instead of a copy per column type."""
+    class ReadOnlyColumnHandler(ColumnTypeHandler):
+        def validate_value(self, value, settings):
+            if isinstance(value, dict) and timestamp_key in value:
+                try:
+                    # str() first: a non-string timestamp (epoch int, None)
+                    # should fall through to the rejection, not raise
+                    _parse_dt(str(value[timestamp_key]))
+                    return ValidationResult(True, value)
+                except ValueError:
+                    pass
+            return ValidationResult(False, message=f"{col_name} is a read-only column")
+    ReadOnlyColumnHandler.__name__ = ReadOnlyColumnHandler.__qualname__ = (
+        f"{col_name.title().replace('_', '')}ColumnHandler")
+    return ReadOnlyColumnHandler
+
+CreationLogColumnHandler = _make_readonly_handler("created_at", "creation_log")
+LastUpdatedColumnHandler = _make_readonly_handler("updated_at", "last_updated")
+
+class TimelineColumnHandler(ColumnTypeHandler):
+    def validate_value(self, value, settings):
+        if not isinstance(value, dict) or "from" not in value or "to" not in value:
+            return ValidationResult(
+                False, message="Timeline expects {'from': date, 'to': date}")
+        try:
+            start = _parse_dt(str(value["from"]))
+            end = _parse_dt(str(value["to"]))
+        except ValueError:
+            return ValidationResult(False, message=f"Invalid timeline dates: {value}")
+
+        if start > end:
+            return ValidationResult(False, message="Timeline 'from' is after 'to'")
+        return ValidationResult(True, value)
+
+    def transform_value(self, value, settings):
+        return {"timeline": {"from": str(value["from"])[:10], "to": str(value["to"])[:10]}}
+
+# Handler registry keyed by the Monday column type string. Handlers are
+# stateless, so aliased types (long_text/text, color/status) share one
+# instance rather than constructing their own
+_text_handler = TextColumnHandler()
+_status_handler = StatusColumnHandler()
+
+COLUMN_TYPE_HANDLERS = {
+    "text": _text_handler,
+    "long_text": _text_handler,
+    "status": _status_handler,
+    "color": _status_handler,
+    "dropdown": DropdownColumnHandler(),
+    "numbers": NumberColumnHandler(),
+    "date": DateColumnHandler(),
+    "hour": HourColumnHandler(),
+    "week": WeekColumnHandler(),
+    "rating": RatingColumnHandler(),
+    "email": EmailColumnHandler(),
+    "link": LinkColumnHandler(),
+    "location": LocationColumnHandler(),
+    "mirror": MirrorColumnHandler(),
+    "creation_log": CreationLogColumnHandler(),
+    "last_updated": LastUpdatedColumnHandler(),
+    "timeline": TimelineColumnHandler(),
+}
+
+def _transform_only(handler):
+    """Format shortcut for handlers whose validation always passes"""
+    def format_value(value, settings):
+        return ValidationResult(True, handler.transform_value(value, settings))
+    return format_value
+
+# Bound format entry points, one dict lookup per cell with no attribute or
+# virtual dispatch; handlers that keep the base accept-everything validation
+# skip the validate step entirely
+COLUMN_TYPE_FORMAT = {
+    col_type: (_transform_only(handler)
+               if type(handler).validate_value is ColumnTypeHandler.validate_value
+               else handler.format_value)
+    for col_type, handler in COLUMN_TYPE_HANDLERS.items()
+}
+
+@lru_cache(maxsize=512)
+def parse_settings(settings_str):
+    """Parsed settings dict for a column's settings_str.
+
+    The same strings recur on every request for a given board, so this is
+    memoized; callers must treat the returned dict as read-only."""
+    if not settings_str:
+        return {}
+    try:
+        return _loads(settings_str)
+    except (ValueError, TypeError):
+        return {}
+
+def process_column_values(column_values, columns):
+    """Validate and transform raw column values against the board columns.
+
+    Returns (formatted_values, errors); unknown columns/types pass through
+    untouched so new Monday column types keep working."""
+    columns_by_id = {col.get("id"): col for col in columns}
+    formatted, errors = {}, []
+
+    # Pre-bound lookups: the loop resolves a column and its format entry per
+    # submitted value, so skip the repeated attribute walks
+    get_column = columns_by_id.get
+    get_format = COLUMN_TYPE_FORMAT.get
+
+    for col_id, value in column_values.items():
+        column = get_column(col_id)
+        format_value = get_format(column.get("type")) if column else None
+        if format_value is None:
+            formatted[col_id] = value
+            continue
+
+        settings = parse_settings(column.get("settings_str"))
+
+        result = format_value(value, settings)
+        if result.is_valid:
+            formatted[col_id] = result.value
+        else:
+            error = f"{col_id}: {result.message}"
+            if result.suggestions:
+                error += f" (did you mean: {', '.join(result.suggestions)}?)"
+            errors.append(error)
+
+    return formatted, errors
@@ -3,16 +3,31 @@ Configuration for the MCP-Monday integration.
 Handles environment variables, logging, and client initialization.
 """
 import os
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+import httpx
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 from monday import MondayClient
 
-# Configure logging
+# Configure logging (level overridable via MCP_LOG_LEVEL). Records are only
+# enqueued on the calling thread; the QueueListener thread does the disk and
+# stream writes so logging never blocks the event loop
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(
+    _log_queue,
+    logging.FileHandler('monday_server.log', encoding='utf-8'),
+    logging.StreamHandler()
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.environ.get('MCP_LOG_LEVEL', 'INFO'),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.FileHandler('monday_server.log'), logging.StreamHandler()]
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger('monday_mcp')
 
@@ -33,4 +48,41 @@ mcp = FastMCP(
 )
 
 # Initialize Monday client
-monday_client = MondayClient(token=MONDAY_API_KEY)
\ No newline at end of file
+monday_client = MondayClient(token=MONDAY_API_KEY)
+
+# Monday.com GraphQL endpoint
+MONDAY_API_URL = "https://api.monday.com/v2"
+
+# Shared HTTP client for GraphQL queries. A single pooled AsyncClient keeps
+# connections alive across requests, so each query skips the TCP/TLS
+# handshake a fresh client would pay. Created lazily inside the running loop.
+_http_client = None
+
+async def get_http_client():
+    """Long-lived httpx.AsyncClient with pre-baked auth headers"""
+    global _http_client
+    if _http_client is None:
+        client_args = dict(
+            base_url=MONDAY_API_URL,
+            headers={
+                "Authorization": MONDAY_API_KEY or "",
+                "Content-Type": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+            },
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(10.0),
+        )
+        try:
+            # HTTP/2 multiplexes concurrent queries over one connection;
+            # needs the optional h2 package, so fall back to HTTP/1.1
+            _http_client = httpx.AsyncClient(http2=True, **client_args)
+        except ImportError:
+            _http_client = httpx.AsyncClient(**client_args)
+    return _http_client
+
+async def close_http_client():
+    """Release the shared client's connection pool"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
\ No newline at end of file
@@ -2,13 +2,75 @@
 MCP resources for Monday.com integration.
 Provides resource handlers for accessing Monday.com data.
 """
+import asyncio
+import hashlib
 import json
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from functools import wraps
-from .config import mcp, monday_client, MONDAY_BOARD_ID, logger
+import httpx
+from .config import mcp, monday_client, MONDAY_BOARD_ID, logger, get_http_client
+from .column_handlers import COLUMN_TYPE_HANDLERS, parse_settings
 
-# Simplified cache system
-CACHE = {"data": {}, "timestamp": {}, "duration": timedelta(minutes=5)}
+# orjson serializes resource payloads several times faster than stdlib json
+# and is already an optional speedup elsewhere in the package
+try:
+    import orjson
+
+    def _loads(data):
+        """Parse a JSON response body"""
+        return orjson.loads(data)
+
+    def _dumps(data):
+        """Serialize a resource payload"""
+        return orjson.dumps(data).decode()
+except ImportError:
+    def _loads(data):
+        """Parse a JSON response body"""
+        return json.loads(data)
+
+    def _dumps(data):
+        """Serialize a resource payload"""
+        return json.dumps(data)
+
+# Simplified cache system: a size-bounded LRU so per-item and per-column keys
+# cannot grow without limit in a long-lived server. Entries hold the payload
+# and the JSON string built when they were stored, so hits return the string
+# directly instead of re-dumping the same payload on every request. Error
+# payloads are kept briefly too, so a bad id does not re-query Monday.com on
+# every retry.
+CACHE = OrderedDict()  # key -> (data, serialized, timestamp, ttl)
+CACHE_MAX_ENTRIES = 1024
+CACHE_DURATION = timedelta(minutes=5)
+ERROR_CACHE_DURATION = timedelta(seconds=30)
+
+def _cache_get(key):
+    """Fresh cache entry for key, or None; hits move to the LRU tail"""
+    entry = CACHE.get(key)
+    if entry is None or datetime.now() - entry[2] >= entry[3]:
+        return None
+    CACHE.move_to_end(key)
+    return entry
+
+def _cache_put(key, data, serialized, ttl=CACHE_DURATION):
+    CACHE[key] = (data, serialized, datetime.now(), ttl)
+    CACHE.move_to_end(key)
+    while len(CACHE) > CACHE_MAX_ENTRIES:
+        evicted, _ = CACHE.popitem(last=False)
+        # Retire the evicted key's refresh lock with it, otherwise one-shot
+        # keys (items_page cursors) leak a lock apiece for the process life
+        _refresh_locks.pop(evicted, None)
+
+# Per-key refresh locks so concurrent misses on one key coalesce into a
+# single fetch (single-flight). Locks are created lazily so they bind to the
+# running loop; setdefault keeps creation race-free.
+_refresh_locks = {}
+
+def _refresh_lock(key):
+    lock = _refresh_locks.get(key)
+    if lock is None:
+        lock = _refresh_locks.setdefault(key, asyncio.Lock())
+    return lock
 
 def cached(key_template):
     """Compact decorator for resource caching"""
@@ -17,21 +79,33 @@ def cached(key_template):
         async def wrapper(*args, **kwargs):
             # Generate key with dynamic parameters
             key = key_template.format(*args, **kwargs, board=MONDAY_BOARD_ID)
-            
+
             # Check cache
-            if (key in CACHE["timestamp"] and 
-                datetime.now() - CACHE["timestamp"][key] < CACHE["duration"]):
-                return json.dumps(CACHE["data"][key])
-            
-            # Execute function and store in cache
-            try:
-                result = await func(*args, **kwargs)
-                CACHE["data"][key] = result
-                CACHE["timestamp"][key] = datetime.now()
-                return json.dumps(result)
-            except Exception as e:
-                logger.error(f"Error in {func.__name__}: {str(e)}")
-                return json.dumps({"error": str(e)})
+            entry = _cache_get(key)
+            if entry is not None:
+                return entry[1]
+
+            async with _refresh_lock(key):
+                # Re-check after acquiring: another coroutine may have
+                # refreshed this key while we waited
+                entry = _cache_get(key)
+                if entry is not None:
+                    return entry[1]
+
+                # Execute function and store in cache; not-found payloads get
+                # the short negative TTL so they can recover quickly
+                try:
+                    result = await func(*args, **kwargs)
+                    serialized = _dumps(result)
+                    is_error = isinstance(result, dict) and "error" in result
+                    _cache_put(key, result, serialized,
+                               ERROR_CACHE_DURATION if is_error else CACHE_DURATION)
+                    return serialized
+                except Exception as e:
+                    logger.error("Error in %s: %s", func.__name__, e)
+                    serialized = _dumps({"error": str(e)})
+                    _cache_put(key, None, serialized, ERROR_CACHE_DURATION)
+                    return serialized
         return wrapper
     return decorator
 
@@ -47,34 +121,105 @@ QUERY = {
         }}
     }}""",
     
-    "items": """query {{ 
-        boards(ids: {board_id}) {{ 
-            items_page(limit: {limit}) {{ items {{ 
+    "items": """query {{
+        boards(ids: {board_id}) {{
+            items_page(limit: {limit}) {{ cursor items {{
                 id name column_values {{ id title text value }} group {{ id title }}
             }} }}
         }}
     }}""",
+
+    "items_cursor": """query {{
+        next_items_page(limit: {limit}, cursor: "{cursor}") {{ cursor items {{
+            id name column_values {{ id title text value }} group {{ id title }}
+        }} }}
+    }}""",
     
-    "item": """query {{ 
-        items(ids: {item_id}) {{ 
+    "item": """query {{
+        items(ids: {item_id}) {{
             id name column_values {{ id title text value }} group {{ id title }}
         }}
     }}"""
 }
 
+# Board-scoped queries bound once at import: MONDAY_BOARD_ID is fixed for the
+# process, so there is no reason to re-format the multi-line templates on
+# every fetch
+BOUND_QUERY = {
+    "schema": QUERY["schema"].format(board_id=MONDAY_BOARD_ID),
+    "items": QUERY["items"].format(board_id=MONDAY_BOARD_ID, limit=100),
+}
+
+# Automatic Persisted Queries: once the server knows a query's SHA-256 it
+# accepts the 64-byte hash instead of the kilobyte query text. Hashes are
+# memoized per query string; if the server refuses the extension the flag
+# flips and all requests go back to plain query posts.
+_apq_hashes = {}
+_apq_supported = True
+
+def _apq_extensions(query):
+    digest = _apq_hashes.get(query)
+    if digest is None:
+        digest = _apq_hashes.setdefault(
+            query, hashlib.sha256(query.encode()).hexdigest())
+    return {"persistedQuery": {"version": 1, "sha256Hash": digest}}
+
+def _apq_miss(payload):
+    """True when the errors say the persisted query is not registered yet"""
+    return any(
+        (err.get("extensions") or {}).get("code") == "PERSISTED_QUERY_NOT_FOUND"
+        or "PersistedQueryNotFound" in str(err.get("message", ""))
+        for err in payload.get("errors") or ()
+    )
+
+async def _gql_post(client, body):
+    """POST one GraphQL request body and parse the response"""
+    response = await client.post("", json=body)
+    response.raise_for_status()
+    return _loads(response.content)
+
+async def _post_query(client, query):
+    """Execute a query, preferring the APQ hash-only form.
+
+    Only a PERSISTED_QUERY_NOT_FOUND reply triggers the one-time full-text
+    registration; any other reaction to the hash-only body (an HTTP error or
+    an unrelated GraphQL error — that body carries no query, so the server
+    must have ignored the extension) disables APQ for the process."""
+    global _apq_supported
+    if _apq_supported:
+        try:
+            payload = await _gql_post(client, {"extensions": _apq_extensions(query)})
+        except httpx.HTTPStatusError:
+            _apq_supported = False
+        else:
+            if _apq_miss(payload):
+                # Register the hash by resending the full text once; errors
+                # in this reply are real query errors and pass through
+                return await _gql_post(
+                    client, {"query": query, "extensions": _apq_extensions(query)})
+            if not payload.get("errors"):
+                return payload
+            _apq_supported = False
+    return await _gql_post(client, {"query": query})
+
 # Optimized data retrieval functions
 async def fetch_data(query_key, **params):
-    """Central function for executing GraphQL queries with parameters"""
+    """Central function for executing GraphQL queries with parameters.
+
+    Queries go through the shared pooled client, so they reuse kept-alive
+    connections and never block the event loop the way the synchronous
+    monday_client call did."""
     try:
-        query = QUERY[query_key].format(**params)
-        return monday_client.custom._query(query)
+        query = BOUND_QUERY[query_key] if not params else QUERY[query_key].format(**params)
+        client = await get_http_client()
+        return await _post_query(client, query)
     except Exception as e:
-        logger.error(f"Error in query {query_key}: {e}")
+        logger.error("Error in query %s: %s", query_key, e)
         return None
 
 async def get_schema_data():
     """Get board schema"""
-    response = await fetch_data("schema", board_id=MONDAY_BOARD_ID)
+    response = await fetch_data("schema")
     
     if not response or "data" not in response or not response["data"].get("boards"):
         return {"board_info": {"id": MONDAY_BOARD_ID}, "columns": [], "groups": []}
@@ -96,22 +241,40 @@ async def get_schema_data():
 async def get_items_data(limit=100):
     """Get board items"""
     try:
-        response = await fetch_data("items", board_id=MONDAY_BOARD_ID, limit=limit)
+        if limit == 100:
+            response = await fetch_data("items")
+        else:
+            response = await fetch_data("items", board_id=MONDAY_BOARD_ID, limit=limit)
         
         if response and "data" in response and "boards" in response["data"]:
-            items = response["data"]["boards"][0]["items_page"]["items"]
-            return {"count": len(items), "items": items}
-        
+            page = response["data"]["boards"][0]["items_page"]
+            items = page["items"]
+            # Boards larger than one page are walked with the cursor via the
+            # items/page/{cursor} resource instead of raising the limit
+            return {"count": len(items), "items": items,
+                    "next_cursor": page.get("cursor")}
+
         # Fallback method if GraphQL fails
         return await fallback_get_items()
     except Exception:
         return await fallback_get_items()
 
+async def get_items_page_data(cursor, limit=100):
+    """Get the page of board items at a pagination cursor"""
+    response = await fetch_data("items_cursor", cursor=cursor, limit=limit)
+
+    if response and "data" in response and response["data"].get("next_items_page"):
+        page = response["data"]["next_items_page"]
+        items = page.get("items", [])
+        return {"count": len(items), "items": items,
+                "next_cursor": page.get("cursor")}
+    return {"count": 0, "items": [], "next_cursor": None}
+
 async def fallback_get_items():
     """Fallback method using standard API"""
     data = monday_client.boards.fetch_items_by_board_id(MONDAY_BOARD_ID, limit=100)
     items = data.get("data", {}).get("boards", [{}])[0].get("items_page", {}).get("items", [])
-    return {"count": len(items), "items": items}
+    return {"count": len(items), "items": items, "next_cursor": None}
 
 async def get_item_data(item_id):
     """Get a specific item"""
@@ -124,6 +287,26 @@ async def get_item_data(item_id):
     data = monday_client.items.fetch_items_by_id([item_id])
     return data.get("data", {}).get("items", [None])[0]
 
+async def _schema_cached():
+    """Board schema dict, shared with the monday://board/schema cache.
+
+    The column resources derive their payloads from the schema; reading
+    through the same cache entry means a fresh schema fetch feeds all of
+    them instead of each resource refetching the board."""
+    key = f"schema:{MONDAY_BOARD_ID}"
+    entry = _cache_get(key)
+    if entry is not None and entry[0] is not None:
+        return entry[0]
+
+    async with _refresh_lock(key):
+        entry = _cache_get(key)
+        if entry is not None and entry[0] is not None:
+            return entry[0]
+
+        data = await get_schema_data()
+        _cache_put(key, data, _dumps(data))
+        return data
+
 # Optimized MCP resources
 @mcp.resource("monday://board/schema")
 @cached("schema:{board}")
@@ -137,6 +320,13 @@ async def get_board_items():
     """Board items"""
     return await get_items_data()
 
+@mcp.resource("monday://board/items/page/{cursor}")
+@cached("items_page:{cursor}")
+async def get_board_items_page(cursor):
+    """Page of board items at a pagination cursor; follow next_cursor until
+    it is null to stream a large board one page at a time"""
+    return await get_items_page_data(cursor)
+
 @mcp.resource("monday://board/item/{item_id}")
 @cached("item:{item_id}")
 async def get_item(item_id):
@@ -148,26 +338,43 @@ async def get_item(item_id):
 @cached("columns:{board}")
 async def get_all_columns():
     """All columns in the board"""
-    schema = await get_schema_data()
+    schema = await _schema_cached()
     return schema["columns"]
 
+# Column index memoized by schema identity: rebuilt only when a refresh
+# produces a new schema dict, so per-column lookups are one hash probe
+_columns_index = (None, None)
+
+def _columns_by_id(schema):
+    global _columns_index
+    cached_schema, index = _columns_index
+    if cached_schema is not schema:
+        index = {col["id"]: col for col in schema.get("columns", [])}
+        _columns_index = (schema, index)
+    return index
+
 @mcp.resource("monday://board/columns/{column_id}")
 @cached("column:{column_id}")
 async def get_column_info(column_id):
     """Detailed information about a specific column"""
-    schema = await get_schema_data()
-    column = next((col for col in schema["columns"] if col["id"] == column_id), None)
+    schema = await _schema_cached()
+    column = _columns_by_id(schema).get(column_id)
     
     if not column:
         return {"error": f"Column {column_id} not found"}
     
-    settings = json.loads(column["settings_str"]) if "settings_str" in column else {}
+    settings = parse_settings(column.get("settings_str"))
+
+    # Rules are pure functions of (type, settings); the handlers memoize the
+    # settings-derived ones, so repeated requests share one dict
+    handler = COLUMN_TYPE_HANDLERS.get(column["type"])
     return {
-        "id": column["id"], 
-        "title": column["title"], 
+        "id": column["id"],
+        "title": column["title"],
         "type": column["type"],
-        "settings": settings, 
+        "settings": settings,
         "width": column.get("width"),
         "archived": column.get("archived", False),
-        "description": column.get("description", "")
+        "description": column.get("description", ""),
+        "validation_rules": handler.get_validation_rules(settings) if handler else {}
     }
\ No newline at end of file
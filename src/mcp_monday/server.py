@@ -3,15 +3,14 @@ Monday.com MCP Server implementation.
 Provides the server functionality for the MCP-Monday integration.
 """
 import sys
-import os
 from .config import mcp, logger
 
 def configure_windows_encoding():
     """Configure Windows encoding if needed."""
+    # reconfigure() alone covers UTF-8 I/O; the old msvcrt.setmode binary
+    # switch defeated text-mode newline handling and added an extra
+    # encode/decode pass per read
     if sys.platform == 'win32':
-        import msvcrt
-        msvcrt.setmode(sys.stdout.fileno(), os.O_BINARY)
-        msvcrt.setmode(sys.stdin.fileno(), os.O_BINARY)
         sys.stdout.reconfigure(encoding='utf-8', errors='replace')
         sys.stdin.reconfigure(encoding='utf-8', errors='replace')
 
@@ -24,7 +23,7 @@ def determine_transport():
         if transport in ["stdio", "sse"]:
             transport_type = transport
             
-    logger.info(f"Using transport: {transport_type}")
+    logger.info("Using transport: %s", transport_type)
     return transport_type
 
 def main():
@@ -36,7 +35,16 @@ def main():
     
     # Configure Windows encoding if needed
     configure_windows_encoding()
-    
+
+    # Prefer uvloop's libuv-backed event loop for the stdio/sse transports
+    # (Unix-only; the default loop is used when it is not installed)
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
     # Determine transport type
     transport_type = determine_transport()
     
@@ -50,7 +58,7 @@ def main():
         mcp.run(transport=transport_type)
         
     except Exception as e:
-        logger.critical(f"Fatal server error: {str(e)}", exc_info=True)
+        logger.critical("Fatal server error: %s", e, exc_info=True)
         sys.exit(1)
 
 if __name__ == "__main__":
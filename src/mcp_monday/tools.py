@@ -5,6 +5,7 @@ Provides tools for interacting with Monday.com boards and items.
 import json
 from functools import wraps
 from .config import mcp, monday_client, MONDAY_BOARD_ID, logger
+from .column_handlers import process_column_values, parse_settings
 from mcp.server.fastmcp.server import Context
 
 # Decorators and utilities to simplify tools
@@ -15,7 +16,7 @@ def error_handler(func):
         try:
             return await func(*args, **kwargs)
         except Exception as e:
-            logger.error(f"Error in {func.__name__}: {str(e)}")
+            logger.error("Error in %s: %s", func.__name__, e)
             return {"success": False, "error": str(e)}
     return wrapper
 
@@ -35,12 +36,9 @@ def parse_column_options(columns):
     for col in columns:
         info = {"id": col.get("id", ""), "title": col.get("title", ""), "type": col.get("type", "")}
         
-        if "settings_str" in col and col["settings_str"]:
-            try:
-                settings = json.loads(col["settings_str"])
-                if "labels" in settings: info["options"] = settings["labels"]
-            except: pass
-        
+        settings = parse_settings(col.get("settings_str"))
+        if "labels" in settings: info["options"] = settings["labels"]
+
         result.append(info)
     return result
 
@@ -62,12 +60,20 @@ async def get_board_schema(ctx: Context):
         "groups": schema.get("groups", [])
     }
 
-@mcp.tool(name="get_board_items", description="Get board items")
+@mcp.tool(name="get_board_items", description="Get board items (pass cursor for the next page)")
 @error_handler
-async def get_board_items(ctx: Context):
-    """Get items from the Monday.com board"""
-    items = await load_items(ctx)
-    return {"count": items.get("count", 0), "items": items.get("items", [])}
+async def get_board_items(ctx: Context, cursor: str = None):
+    """Get items from the Monday.com board.
+
+    Pass a previous call's next_cursor to fetch the following page; a null
+    next_cursor in the response means the board is exhausted."""
+    if cursor:
+        page_data = await ctx.read_resource(f"monday://board/items/page/{cursor}")
+        items = json.loads(page_data.content)
+    else:
+        items = await load_items(ctx)
+    return {"count": items.get("count", 0), "items": items.get("items", []),
+            "next_cursor": items.get("next_cursor")}
 
 @mcp.tool(name="get_board_data", description="Get combined schema and data")
 @error_handler
@@ -85,7 +91,8 @@ async def get_board_data(ctx: Context):
         "columns": schema["columns"],
         "groups": schema["groups"],
         "items": items["items"],
-        "items_count": items["count"]
+        "items_count": items["count"],
+        "next_cursor": items.get("next_cursor")
     }
 
 @mcp.tool(name="search_board_items", description="Search items by field and value")
@@ -154,15 +161,21 @@ async def delete_board_items(ctx: Context, field: str, value: str):
 @error_handler
 async def create_board_item(ctx: Context, item_name: str, column_values: dict, group_id: str = None):
     """Create a new item in the Monday.com board"""
+    schema = await load_schema(ctx)
+
     # Get default group if none provided
     if not group_id:
-        schema = await load_schema(ctx)
         groups = schema.get("groups", [])
         group_id = groups[0]["id"] if groups else None
-    
+
     if not group_id:
         return {"success": False, "message": "No group ID provided and no default found"}
-    
+
+    # Validate and transform values through the per-type column handlers
+    column_values, errors = process_column_values(column_values, schema.get("columns", []))
+    if errors:
+        return {"success": False, "message": "Invalid column values", "errors": errors}
+
     # Create item
     result = monday_client.items.create_item(
         board_id=int(MONDAY_BOARD_ID),
@@ -182,6 +195,13 @@ async def create_board_item(ctx: Context, item_name: str, column_values: dict, g
 @error_handler
 async def update_board_item(ctx: Context, item_id: str, column_values: dict):
     """Update an existing item in the Monday.com board"""
+    schema = await load_schema(ctx)
+
+    # Validate and transform values through the per-type column handlers
+    column_values, errors = process_column_values(column_values, schema.get("columns", []))
+    if errors:
+        return {"success": False, "message": "Invalid column values", "errors": errors}
+
     result = monday_client.items.change_multiple_column_values(
         board_id=int(MONDAY_BOARD_ID),
         item_id=item_id, 